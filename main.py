@@ -40,6 +40,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Subtitle line filters, compiled once: every OCR line goes through them
+_LETTER_RE = re.compile(r'[a-zA-Z]')
+_TECH_CODE_LINE_RE = re.compile(r'^[A-Z]{2,}\s*[\d\(\)\s]+$')
+# One scan for "DI (105" / "ABC 12" style codes and "Baby E1" episode ids
+_METADATA_RE = re.compile(r'[A-Z]{2,}\s*\(?\s*\d+|[A-Z][a-z]+\s+E\d+')
+_TWO_NAMES_RE = re.compile(r'[A-Z][a-z]+\s+[A-Z][a-z]+')
+_TECH_SYMBOL_RE = re.compile(r'[|=\-\+\*]')
+
 @dataclass
 class Config:
     """Configuration class for the application"""
@@ -178,32 +186,25 @@ class SubtitleTranslator:
             return False
         
         # Skip lines that are mostly numbers or symbols
-        letter_count = len(re.findall(r'[a-zA-Z]', linea))
+        letter_count = len(_LETTER_RE.findall(linea))
         if letter_count < len(linea) * 0.3:  # At least 30% should be letters
             return False
         
         # Skip lines that are just technical codes
-        if re.match(r'^[A-Z]{2,}\s*[\d\(\)\s]+$', linea):
-            return False
-        
-        # Skip lines that contain technical metadata patterns
-        if re.search(r'[A-Z]{2,}\s+\d+', linea):  # Like "Baby E1"
-            return False
-        
-        # Skip lines that contain episode identifiers
-        if re.search(r'[A-Z][a-z]+\s+E\d+', linea):  # Like "Baby E1"
+        if _TECH_CODE_LINE_RE.match(linea):
             return False
         
-        # Skip lines that contain technical codes with metadata
-        if re.search(r'[A-Z]{2,}\s*\(?\s*\d+', linea):  # Like "DI (105"
+        # Skip lines that contain technical metadata, episode identifiers
+        # or technical codes with metadata (like "Baby E1" or "DI (105")
+        if _METADATA_RE.search(linea):
             return False
         
         # Skip lines that contain mostly technical codes and show names
-        if re.search(r'[A-Z][a-z]+\s+[A-Z][a-z]+', linea) and len(linea) < 20:
+        if len(linea) < 20 and _TWO_NAMES_RE.search(linea):
             return False
         
         # Skip lines that contain technical symbols like | = etc.
-        if re.search(r'[|=\-\+\*]', linea) and len(linea) < 25:
+        if len(linea) < 25 and _TECH_SYMBOL_RE.search(linea):
             return False
         
         # If we get here, it's likely a subtitle line
@@ -5,34 +5,84 @@ Implements non-blocking bottom fade for grammar cards display.
 """
 
 import sys
+import re
 import json
-import tempfile
 import os
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QScrollArea, QLabel, QPushButton, QTabWidget, QFrame, QTextEdit,
-    QGraphicsDropShadowEffect
+    QScrollArea, QLabel, QPushButton, QTabWidget, QFrame,
+    QSizePolicy
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QMargins, QRect, QRectF, pyqtSignal, pyqtProperty, QPropertyAnimation, QEasingCurve,
+    QParallelAnimationGroup, QAbstractAnimation, QThreadPool, QMutex, QMutexLocker
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import (
-    QPainter, QLinearGradient, QColor, QPalette, QBrush, QPen,
+    QPainter, QLinearGradient, QGradient, QColor, QPalette, QBrush, QPen,
     QKeySequence, QFont, QPixmap, QShortcut
 )
 
+# Prefer orjson for grammar payloads when it is installed. It rejects
+# NaN/Infinity, overflowing numbers and lone surrogates that json.loads
+# accepts, so its failures are retried with the stdlib
+try:
+    import orjson
+except ImportError:
+    _json_loads = json.loads
+else:
+    def _json_loads(s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return json.loads(s)
+
+# Same switch popup_launcher uses to keep the popup's stdout visible
+_DEBUG = os.getenv('POPUP_DEBUG', '0') == '1'
+
+# "- word: explanation (function)" lines. The optional dash prefix is dropped,
+# the word runs up to the first colon and the function is the text inside the
+# last parenthesis pair (only the last "(" can be followed by a ")" and then no
+# more parentheses up to the end of the line)
+_GRAMMAR_LINE_RE = re.compile(
+    r'^\s*(?:-[- ]*)?([^:\n]*):(([^\n]*?)(?:\(([^(\n]*)\)[^()\n]*)?)$',
+    re.MULTILINE,
+)
+
+# Parenthesized text only counts as a grammatical function if it mentions one of these
+_GRAMMAR_FUNCTION_RE = re.compile(
+    'sustantivo|verbo|adjetivo|adverbio|preposición|conjunción|pronombre|artículo|'
+    'presente|pasado|participio|infinitivo|singular|plural|femenino|masculino',
+    re.IGNORECASE,
+)
+
 
 class FadeOverlay(QWidget):
     """
-    Transparent overlay widget that creates a gradient fade effect on all sides.
-    Attaches to scroll area viewport and tracks scrolling automatically.
+    Transparent overlay widget that fades the bottom of a scroll area into the background.
+    Attaches to the bottom strip of a scroll area viewport and follows its width
+    automatically, so repaints elsewhere in the viewport never reach it.
     """
-    
+
+    # Share of the fade (at the viewport edge) painted as solid background
+    OPAQUE_RATIO = 0.25
+
     def __init__(self, scroll_area: QScrollArea, fade_height: int = 64, background_color: str = "#0b0b0b"):
         super().__init__(scroll_area.viewport())
         self.scroll_area = scroll_area
         self.fade_height = fade_height
         self.background_color = background_color
+
+        # Gradient stops, parsed once from the background color
+        bg_color = QColor(background_color)
+        self._c0 = QColor(bg_color.red(), bg_color.green(), bg_color.blue(), 0)      # Start: transparent
+        self._c1 = QColor(bg_color.red(), bg_color.green(), bg_color.blue(), 128)    # Middle: semi-transparent
+        self._c2 = QColor(bg_color.red(), bg_color.green(), bg_color.blue(), 255)    # End: solid popup background
+
+        # Paint-ready state, refreshed by resizeEvent (Qt always resizes before the first paint)
+        self._fade_pixmap = QPixmap()
+        self._band_rect = QRect()
         self.setup_overlay()
-        self.connect_scroll_tracking()
+        self.attach_to_viewport()
     
     def setup_overlay(self):
         """Initialize overlay properties and attributes"""
@@ -40,233 +90,486 @@ class FadeOverlay(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
         
-        # Position overlay initially
-        self.update_position()
-        
         # Ensure overlay is on top
         self.raise_()
         self.show()
     
-    def connect_scroll_tracking(self):
-        """Connect to scroll events for position updates"""
-        # Track vertical scrolling
-        if self.scroll_area.verticalScrollBar():
-            self.scroll_area.verticalScrollBar().valueChanged.connect(self.update_position)
-        
-        # Track resize events
-        self.scroll_area.viewport().resizeEvent = self.on_viewport_resize
-    
-    def on_viewport_resize(self, event):
-        """Handle viewport resize events"""
-        super(QWidget, self.scroll_area.viewport()).resizeEvent(event)
-        self.update_position()
-    
-    def update_position(self):
-        """Update overlay position and size to cover entire viewport"""
-        if not self.scroll_area or not self.scroll_area.viewport():
-            return
-            
+    def attach_to_viewport(self):
+        """Let a viewport layout size and pin the overlay to the viewport bottom"""
+        # The fade is fixed to the viewport, not to the scrolled content,
+        # so scrolling never moves or resizes the overlay. A layout follows
+        # viewport resizes in C++ without sending every viewport event to Python.
         viewport = self.scroll_area.viewport()
-        viewport_rect = viewport.rect()
-        
-        # Cover the entire viewport for bottom fade
-        self.setGeometry(viewport_rect)
+        layout = viewport.layout()
+        if layout is None:
+            layout = QVBoxLayout(viewport)
+            layout.setContentsMargins(0, 0, 0, 0)
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
+        self.setFixedHeight(self.fade_height)
+        layout.addWidget(self, 0, Qt.AlignmentFlag.AlignBottom)
+    
+    def resizeEvent(self, event):
+        """Re-render the cached fade and band geometry for the new size"""
+        super().resizeEvent(event)
+        size = event.size()
+
+        # The cached fade only depends on the width
+        if size.width() != event.oldSize().width():
+            self._rebuild_pixmap(size.width())
+
+        # The overlay is exactly fade_height tall: falloff on top, solid band below
+        opaque_size = int(self.fade_height * self.OPAQUE_RATIO)
+        self._band_rect = QRect(0, size.height() - opaque_size, size.width(), opaque_size)
+
+    def _rebuild_pixmap(self, width: int):
+        """Render the gradient falloff once into a pixmap reused by every paint"""
+        falloff_size = self.fade_height - int(self.fade_height * self.OPAQUE_RATIO)
+        ratio = self.devicePixelRatioF()
+
+        pixmap = QPixmap(max(1, round(width * ratio)), max(1, round(falloff_size * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        # Falloff gradient: fade from transparent to popup background color
+        gradient = QLinearGradient(0, 0, 0, falloff_size)
+        gradient.setColorAt(0.0, self._c0)
+        gradient.setColorAt(0.5, self._c1)
+        gradient.setColorAt(1.0, self._c2)
+
+        painter = QPainter(pixmap)
+        painter.fillRect(0, 0, width, falloff_size, QBrush(gradient))
+        painter.end()
+
+        self._fade_pixmap = pixmap
     
     def paintEvent(self, event):
         """Paint bottom gradient fade to popup background color"""
+        # Everything below was prepared in resizeEvent. Only axis-aligned
+        # blits and fills: no antialiasing needed
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Set composition mode for proper blending
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-        
-        rect = self.rect()
-        fade_size = self.fade_height
-        
-        # Parse the background color
-        bg_color = QColor(self.background_color)
-        
-        # Bottom gradient: fade from transparent to popup background color
-        bottom_gradient = QLinearGradient(0, rect.height() - fade_size, 0, rect.height())
-        bottom_gradient.setColorAt(0.0, QColor(bg_color.red(), bg_color.green(), bg_color.blue(), 0))      # Start: transparent
-        bottom_gradient.setColorAt(0.5, QColor(bg_color.red(), bg_color.green(), bg_color.blue(), 128))   # Middle: semi-transparent
-        bottom_gradient.setColorAt(1.0, QColor(bg_color.red(), bg_color.green(), bg_color.blue(), 255))   # End: solid popup background
-        
-        bottom_rect = rect
-        bottom_rect.setTop(rect.height() - fade_size)
-        painter.fillRect(bottom_rect, QBrush(bottom_gradient))
+
+        # Blend the cached falloff over the cards underneath (default SourceOver)
+        painter.drawPixmap(0, 0, self._fade_pixmap)
+
+        # The edge band is fully opaque, so write it without reading the destination
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(self._band_rect, self._c2)
+
+
+def _build_shine_brush() -> QBrush:
+    """Build the hover shine gradient once; it stretches to whatever rect it fills"""
+    gradient = QLinearGradient(0, 0, 1, 0)
+    gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+    gradient.setColorAt(0.0, QColor(255, 255, 255, 0))
+    gradient.setColorAt(0.3, QColor(76, 175, 80, 30))  # Green shine
+    gradient.setColorAt(0.7, QColor(76, 175, 80, 30))
+    gradient.setColorAt(1.0, QColor(255, 255, 255, 0))
+    return QBrush(gradient)
+
+
+# Shared by every card, so hover repaints allocate no gradient or colors
+_SHINE_BRUSH = _build_shine_brush()
 
 
 class GrammarCard(QWidget):
     """Individual card widget for grammar explanations with hover animations and enhanced details"""
     
+    # Matches the #grammarCard border-radius in the stylesheet
+    CORNER_RADIUS = 16
+
+    # Layout spacing shared by every card
+    CONTENT_MARGINS = QMargins(20, 16, 20, 16)
+    CONTENT_SPACING = 12
+
     def __init__(self, word_data: dict):
         super().__init__()
         self.word_data = word_data
         self.shine_animation = None
         self.hover_animation = None
         self.is_hovered = False
+        self._glow_radius = 0
+        self._glow_color = QColor(76, 175, 80, 0)
         self.setup_card()
         self.setup_animations()
     
     def setup_card(self):
         """Setup card appearance and content with enhanced details"""
         self.setObjectName("grammarCard")
+
+        # Read each field once
+        word_data = self.word_data
+        word = word_data.get('word', '')
+        difficulty = word_data.get('difficulty')
+        function = word_data.get('function')
+        explanation = word_data.get('explanation', '')
+        additional_info = word_data.get('additional_info')
+        examples = word_data.get('examples')
         
         # Create layout with better spacing
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 16, 20, 16)
-        layout.setSpacing(12)
+        layout.setContentsMargins(self.CONTENT_MARGINS)
+        layout.setSpacing(self.CONTENT_SPACING)
         
         # Word title with larger, more prominent display
-        word_label = QLabel(self.word_data.get('word', ''))
-        word_label.setObjectName("wordTitle")
-        word_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(word_label)
+        self._add_label(layout, word, "wordTitle")
         
         # Difficulty indicator if available
-        if self.word_data.get('difficulty'):
-            difficulty_label = QLabel(f"🎯 {self.word_data['difficulty'].upper()}")
-            difficulty_label.setObjectName("difficultyIndicator")
-            difficulty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(difficulty_label)
+        if difficulty:
+            self._add_label(layout, f"🎯 {difficulty.upper()}", "difficultyIndicator")
         
         # Separator line for visual division
-        separator = QFrame()
+        separator = QFrame(self)
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setObjectName("cardSeparator")
         separator.setFixedHeight(1)
         layout.addWidget(separator)
         
         # Grammatical function with enhanced styling
-        if self.word_data.get('function'):
-            function_label = QLabel(f"📚 {self.word_data['function']}")
-            function_label.setObjectName("grammarFunction")
-            function_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(function_label)
+        if function:
+            self._add_label(layout, f"📚 {function}", "grammarFunction")
         
         # Explanation with better formatting
-        explanation_label = QLabel(self.word_data.get('explanation', ''))
-        explanation_label.setObjectName("grammarExplanation")
-        explanation_label.setWordWrap(True)
-        explanation_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(explanation_label)
+        self._add_label(layout, explanation, "grammarExplanation", wrap=True)
         
         # Additional details section if available
-        if self.word_data.get('additional_info'):
-            details_label = QLabel(f"ℹ️ {self.word_data['additional_info']}")
-            details_label.setObjectName("grammarDetails")
-            details_label.setWordWrap(True)
-            details_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(details_label)
+        if additional_info:
+            self._add_label(layout, f"ℹ️ {additional_info}", "grammarDetails", wrap=True)
         
         # Usage examples if available
-        if self.word_data.get('examples'):
-            examples_label = QLabel(f"💡 Ejemplos: {self.word_data['examples']}")
-            examples_label.setObjectName("grammarExamples")
-            examples_label.setWordWrap(True)
-            examples_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(examples_label)
+        if examples:
+            self._add_label(layout, f"💡 Ejemplos: {examples}", "grammarExamples", wrap=True)
+    
+    def _add_label(self, layout, text, obj_name, wrap=False):
+        """Add a centered label with the given object name to layout"""
+        # Parented up front so addWidget has nothing to reparent
+        label = QLabel(text, self)
+        label.setObjectName(obj_name)
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        if wrap:
+            label.setWordWrap(True)
+        layout.addWidget(label)
+        return label
     
     def setup_animations(self):
         """Setup hover and shine animations"""
-        from PyQt6.QtCore import QPropertyAnimation, QEasingCurve, QParallelAnimationGroup
-        from PyQt6.QtWidgets import QGraphicsOpacityEffect, QGraphicsDropShadowEffect
-        
-        # Create shadow effect for hover glow
-        self.shadow_effect = QGraphicsDropShadowEffect()
-        self.shadow_effect.setBlurRadius(0)
-        self.shadow_effect.setColor(QColor(76, 175, 80, 0))
-        self.shadow_effect.setOffset(0, 2)
-        self.setGraphicsEffect(self.shadow_effect)
-        
-        # Hover animations
-        self.shadow_animation = QPropertyAnimation(self.shadow_effect, b"blurRadius")
+        # Hover glow is painted by the card itself (see paintEvent); a
+        # QGraphicsDropShadowEffect would render every card offscreen and blur it
+        self.shadow_animation = QPropertyAnimation(self, b"glowRadius")
         self.shadow_animation.setDuration(250)
         self.shadow_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.shadow_animation.setStartValue(0)
+        self.shadow_animation.setEndValue(15)
         
-        self.color_animation = QPropertyAnimation(self.shadow_effect, b"color")
+        self.color_animation = QPropertyAnimation(self, b"glowColor")
         self.color_animation.setDuration(250)
         self.color_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.color_animation.setStartValue(QColor(76, 175, 80, 0))
+        self.color_animation.setEndValue(QColor(76, 175, 80, 80))
+        
+        # Both run in lockstep; leaving plays the group backwards
+        self.hover_animation = QParallelAnimationGroup(self)
+        self.hover_animation.addAnimation(self.shadow_animation)
+        self.hover_animation.addAnimation(self.color_animation)
+    
+    def _play_hover(self, direction):
+        """Run the hover animation towards the glowing or the resting state"""
+        if not self.hover_animation:
+            return
+        self.hover_animation.setDirection(direction)
+        # A running group just turns around from where it is
+        if self.hover_animation.state() != QAbstractAnimation.State.Running:
+            self.hover_animation.start()
     
+    @pyqtProperty(int)
+    def glowRadius(self):
+        return self._glow_radius
+
+    @glowRadius.setter
+    def glowRadius(self, value):
+        self._glow_radius = value
+        self.update()
+
+    @pyqtProperty(QColor)
+    def glowColor(self):
+        return self._glow_color
+
+    @glowColor.setter
+    def glowColor(self, value):
+        self._glow_color = value
+        self.update()
+
     def enterEvent(self, event):
         """Handle mouse enter - start hover animation"""
         super().enterEvent(event)
         self.is_hovered = True
         
         # Start glow effect
-        if self.shadow_animation:
-            self.shadow_animation.stop()
-            self.shadow_animation.setStartValue(0)
-            self.shadow_animation.setEndValue(15)
-            self.shadow_animation.start()
+        self._play_hover(QAbstractAnimation.Direction.Forward)
         
-        if self.color_animation:
-            self.color_animation.stop()
-            self.color_animation.setStartValue(QColor(76, 175, 80, 0))
-            self.color_animation.setEndValue(QColor(76, 175, 80, 80))
-            self.color_animation.start()
-        
-        # Trigger shine effect
-        self.start_shine_effect()
+        # Paint the static shine once; nothing animates it afterwards
+        self.update()
     
     def leaveEvent(self, event):
         """Handle mouse leave - reverse hover animation"""
         super().leaveEvent(event)
         self.is_hovered = False
         
-        # Stop glow effect
-        if self.shadow_animation:
-            self.shadow_animation.stop()
-            self.shadow_animation.setStartValue(15)
-            self.shadow_animation.setEndValue(0)
-            self.shadow_animation.start()
-        
-        if self.color_animation:
-            self.color_animation.stop()
-            self.color_animation.setStartValue(QColor(76, 175, 80, 80))
-            self.color_animation.setEndValue(QColor(76, 175, 80, 0))
-            self.color_animation.start()
-    
-    def start_shine_effect(self):
-        """Start a subtle shine animation across the card"""
-        if not self.is_hovered:
-            return
-            
-        # Create a shine timer for periodic effect
-        from PyQt6.QtCore import QTimer
-        
-        def create_shine():
-            if self.is_hovered:  # Only shine if still hovered
-                self.update()  # Trigger repaint for shine
-                
-        if not hasattr(self, 'shine_timer'):
-            self.shine_timer = QTimer()
-            self.shine_timer.timeout.connect(create_shine)
-            self.shine_timer.setSingleShot(True)
-            
-        self.shine_timer.start(100)  # Delay shine slightly
+        # Fade the glow back out
+        self._play_hover(QAbstractAnimation.Direction.Backward)
+
+        # Clear the shine
+        self.update()
     
     def paintEvent(self, event):
-        """Custom paint event with shine effect"""
+        """Custom paint event with hover glow and shine effect"""
         super().paintEvent(event)
-        
-        if self.is_hovered:
-            from PyQt6.QtGui import QPainter, QLinearGradient, QBrush
-            
-            painter = QPainter(self)
+
+        glow_alpha = self._glow_color.alpha()
+        has_glow = glow_alpha > 0 and self._glow_radius > 0
+        if not (has_glow or self.is_hovered):
+            return
+
+        painter = QPainter(self)
+
+        if has_glow:
+            # Soft edge glow: a few fading rounded outlines, one per 3px of radius
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            
-            # Create subtle shine gradient
-            shine_gradient = QLinearGradient(0, 0, self.width(), 0)
-            shine_gradient.setColorAt(0.0, QColor(255, 255, 255, 0))
-            shine_gradient.setColorAt(0.3, QColor(76, 175, 80, 30))  # Green shine
-            shine_gradient.setColorAt(0.7, QColor(76, 175, 80, 30))
-            shine_gradient.setColorAt(1.0, QColor(255, 255, 255, 0))
-            
-            # Paint shine effect
+            rings = max(1, self._glow_radius // 3)
+            color = QColor(self._glow_color)
+            rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
+            for ring in range(rings):
+                color.setAlpha(glow_alpha * (rings - ring) // rings)
+                painter.setPen(QPen(color, 1))
+                radius = self.CORNER_RADIUS - ring
+                painter.drawRoundedRect(rect.adjusted(ring, ring, -ring, -ring), radius, radius)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
+        if self.is_hovered:
+            # Paint shine effect (axis-aligned fill, no antialiasing needed)
             painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Overlay)
-            painter.fillRect(self.rect(), QBrush(shine_gradient))
+            painter.fillRect(self.rect(), _SHINE_BRUSH)
+
+
+# High-contrast palette: almost black/white with blue accents
+BG_PRIMARY = "#0b0b0b"          # near black
+BG_SECONDARY = "#111111"        # slightly lighter black
+TEXT_PRIMARY = "#f4f4f4"        # near white
+TEXT_SECONDARY = "#b9b9b9"      # muted grey
+ACCENT_COLOR = "#2aa3ff"        # vivid blue
+CARD_BG = "#1a1a1a"             # dark card background
+BORDER_COLOR = "#2a2a2a"        # subtle dark border
+
+# The palette is fixed, so the stylesheet is formatted once at import
+_STYLESHEET = f"""
+QMainWindow {{
+    background: transparent;
+}}
+
+#centralWidget {{
+    background: {BG_PRIMARY};
+    border-radius: 12px;
+    border: none;
+}}
+
+#headerFrame {{
+    background: transparent;
+    border: none;
+    padding: 8px 0px;
+}}
+
+#titlePrefix, #titleSuffix {{
+    font-size: 24px;
+    font-weight: 300;
+    color: {TEXT_PRIMARY};
+}}
+
+#titleAccent {{
+    font-size: 24px;
+    font-weight: 900;
+    color: {ACCENT_COLOR};
+}}
+
+#subtitle {{
+    font-size: 12px;
+    color: {TEXT_SECONDARY};
+    font-weight: 400;
+}}
+
+#closeButton {{
+    background: transparent;
+    border: none;
+    border-radius: 16px;
+    color: {TEXT_SECONDARY};
+    font-size: 18px;
+    font-weight: bold;
+}}
+
+#closeButton:hover {{
+    background: rgba(255, 0, 0, 0.15);
+    border: none;
+    color: #ff6b6b;
+}}
+
+#closeButton:pressed {{
+    background: rgba(255, 0, 0, 0.25);
+}}
+
+#mainTabs {{
+    background: transparent;
+    border: none;
+}}
+
+#mainTabs::pane {{
+    border: none;
+    border-radius: 8px;
+    background: {BG_SECONDARY};
+}}
+
+#mainTabs::tab-bar {{
+    /* alignment: center; */
+}}
+
+#mainTabs QTabBar::tab {{
+    background: {BG_SECONDARY};
+    border: none;
+    padding: 8px 16px;
+    margin-right: 2px;
+    border-top-left-radius: 8px;
+    border-top-right-radius: 8px;
+    color: {TEXT_SECONDARY};
+}}
+
+#mainTabs QTabBar::tab:hover {{
+    background: rgba(42, 163, 255, 0.12);
+    color: {ACCENT_COLOR};
+}}
+
+#mainTabs QTabBar::tab:selected {{
+    background: {BG_PRIMARY};
+    color: {ACCENT_COLOR};
+    border: none;
+}}
+
+#textDisplay {{
+    background: transparent;
+    border: none;
+    color: {TEXT_PRIMARY};
+    font-size: 14px;
+    padding: 8px;
+}}
+
+#grammarScrollArea, #textScrollArea {{
+    background: transparent;
+    border: none;
+}}
+
+#grammarCard {{
+    background: {CARD_BG};
+    border: 2px solid {BORDER_COLOR};
+    border-radius: 16px;
+    margin-bottom: 16px;
+    padding: 8px;
+}}
+
+#grammarCard:hover {{
+    background: rgba(76, 175, 80, 0.15);
+    border: 2px solid rgba(76, 175, 80, 0.5);
+}}
+
+#wordTitle {{
+    color: {ACCENT_COLOR};
+    font-size: 20px;
+    font-weight: 900;
+}}
+
+#difficultyIndicator {{
+    color: {ACCENT_COLOR};
+    font-size: 14px;
+    font-weight: 700;
+}}
+
+#grammarFunction {{
+    color: {TEXT_SECONDARY};
+    font-size: 14px;
+    font-style: italic;
+    font-weight: 600;
+}}
+
+#grammarExplanation {{
+    color: {TEXT_PRIMARY};
+    font-size: 16px;
+    font-weight: 500;
+}}
+
+#grammarDetails {{
+    color: {TEXT_SECONDARY};
+    font-size: 13px;
+    font-style: italic;
+}}
+
+#grammarExamples {{
+    color: {ACCENT_COLOR};
+    font-size: 13px;
+    font-weight: 500;
+}}
+
+#cardSeparator {{
+    background: {ACCENT_COLOR};
+    opacity: 0.6;
+}}
+
+#fallbackText {{
+    color: {TEXT_PRIMARY};
+    font-size: 14px;
+}}
+
+#footerFrame {{
+    background: transparent;
+    border: none;
+}}
+
+#statusText {{
+    color: {TEXT_SECONDARY};
+    font-size: 12px;
+}}
+
+#copyButton {{
+    background: {ACCENT_COLOR};
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 6px 12px;
+    font-weight: 600;
+}}
+
+#copyButton:hover {{
+    background: rgba(0, 212, 255, 0.9);
+}}
+
+#copyButton:pressed {{
+    background: rgba(0, 212, 255, 0.7);
+}}
+
+QScrollBar:vertical {{
+    background: {BG_SECONDARY};
+    width: 8px;
+    border-radius: 4px;
+}}
+
+QScrollBar::handle:vertical {{
+    background: {BORDER_COLOR};
+    border-radius: 4px;
+    min-height: 20px;
+}}
+
+QScrollBar::handle:vertical:hover {{
+    background: {ACCENT_COLOR};
+}}
+
+QScrollBar::handle:vertical:pressed {{
+    background: rgba(0, 212, 255, 0.8);
+}}
+"""
 
 
 class PopupWindow(QMainWindow):
@@ -275,23 +578,44 @@ class PopupWindow(QMainWindow):
     Features frameless design, rounded corners, shadow, and proper fade overlay.
     """
     
+    # Emitted from closeEvent, before the window is hidden. Slots doing real
+    # teardown work should connect with Qt.ConnectionType.QueuedConnection so
+    # it runs after the window is gone instead of delaying its disappearance.
     closed = pyqtSignal()
+
+    # Grammar cards built up front; the rest start as placeholders realized on scroll
+    EAGER_CARD_COUNT = 6
+    PLACEHOLDER_CARD_HEIGHT = 140
+    REALIZE_THROTTLE_MS = 16
+    # Extra band above and below the viewport realized ahead of scrolling
+    REALIZE_OVERSCAN = PLACEHOLDER_CARD_HEIGHT
     
     def __init__(self, translation_data: dict):
         super().__init__()
         self.translation_data = translation_data
         self.fade_overlays = []
+        self._card_data = []
+        self._realized = set()
+        self._card_layout = None
+        self._card_scroll_area = None
+        self._realize_timer = None
+        self._parsed_grammar = None
+        self._parse_mutex = QMutex()
+        self._grammar_page = None
+        self._pending_grammar = None
         
         # Debug: Print what data we received
-        print(f"🔍 PopupWindow received data: {list(translation_data.keys())}")
-        for key, value in translation_data.items():
-            if isinstance(value, str):
-                print(f"  {key}: {len(value)} chars - {value[:100]}{'...' if len(value) > 100 else ''}")
-            elif isinstance(value, list):
-                print(f"  {key}: {len(value)} items - {value[:3]}{'...' if len(value) > 3 else ''}")
-            else:
-                print(f"  {key}: {type(value)} - {value}")
-        
+        if _DEBUG:
+            print(f"🔍 PopupWindow received data: {list(translation_data.keys())}")
+            for key, value in translation_data.items():
+                if isinstance(value, str):
+                    print(f"  {key}: {len(value)} chars - {value[:100]}{'...' if len(value) > 100 else ''}")
+                elif isinstance(value, list):
+                    print(f"  {key}: {len(value)} items - {value[:3]}{'...' if len(value) > 3 else ''}")
+                else:
+                    print(f"  {key}: {type(value)} - {value}")
+        
+        self.start_grammar_parse()
         self.setup_window()
         self.setup_ui()
         self.setup_shortcuts()
@@ -301,11 +625,10 @@ class PopupWindow(QMainWindow):
         """Configure window properties for modern appearance"""
         self.setWindowTitle("idIAmas - AI Translation")
         
-        # Frameless, shadowed popup
+        # Frameless popup; the window system draws the drop shadow
         self.setWindowFlags(
             Qt.WindowType.Tool |
-            Qt.WindowType.FramelessWindowHint |
-            Qt.WindowType.NoDropShadowWindowHint  # We'll add our own shadow
+            Qt.WindowType.FramelessWindowHint
         )
         
         # Enable translucent background for rounded corners
@@ -314,13 +637,6 @@ class PopupWindow(QMainWindow):
         # Window size and positioning
         self.resize(900, 600)
         self.center_on_screen()
-        
-        # Add drop shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 100))
-        shadow.setOffset(0, 8)
-        self.setGraphicsEffect(shadow)
     
     def setup_ui(self):
         """Create and setup the user interface"""
@@ -438,18 +754,24 @@ class PopupWindow(QMainWindow):
         grammar_content = None
         if 'grammar_json' in self.translation_data:
             grammar_content = self.translation_data.get('grammar_json')
+        elif 'grammar_parsed' in self.translation_data:
+            # Already in card form (see parse_grammar_content); used as-is
+            grammar_content = self.translation_data.get('grammar_parsed')
         elif 'grammar' in self.translation_data:
             grammar_content = self.translation_data.get('grammar')
 
-        if grammar_content is not None:
-            grammar_tab = self.create_grammar_tab(grammar_content)
-            tab_widget.addTab(grammar_tab, "※ Grammar")
-        else:
+        if grammar_content is None:
             # Fallback: show raw grammar data if available
-            raw_grammar = self.translation_data.get('grammar', '')
-            if raw_grammar:
-                grammar_tab = self.create_grammar_tab(raw_grammar)
-                tab_widget.addTab(grammar_tab, "※ Grammar")
+            grammar_content = self.translation_data.get('grammar', '') or None
+
+        if grammar_content is not None:
+            # The cards are only built once the tab is first opened
+            self._pending_grammar = grammar_content
+            self._grammar_page = QWidget()
+            grammar_page_layout = QVBoxLayout(self._grammar_page)
+            grammar_page_layout.setContentsMargins(0, 0, 0, 0)
+            tab_widget.addTab(self._grammar_page, "※ Grammar")
+            tab_widget.currentChanged.connect(self.on_tab_changed)
         
         parent_layout.addWidget(tab_widget)
     
@@ -459,19 +781,30 @@ class PopupWindow(QMainWindow):
         layout = QVBoxLayout(tab)
         layout.setContentsMargins(16, 16, 16, 16)
         
-        text_edit = QTextEdit()
-        text_edit.setObjectName("textDisplay")
-        text_edit.setPlainText(content)
-        text_edit.setReadOnly(True)
-        layout.addWidget(text_edit)
+        # Read-only text: a selectable label in a scroll area avoids the
+        # document, cursor and undo machinery of a QTextEdit
+        text_label = QLabel(content)
+        text_label.setObjectName("textDisplay")
+        text_label.setTextFormat(Qt.TextFormat.PlainText)
+        text_label.setWordWrap(True)
+        text_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        text_label.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse |
+            Qt.TextInteractionFlag.TextSelectableByKeyboard
+        )
+        
+        scroll_area = QScrollArea()
+        scroll_area.setObjectName("textScrollArea")
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        scroll_area.setWidget(text_label)
+        layout.addWidget(scroll_area)
         
         return tab
     
     def get_background_color(self) -> str:
         """Get the primary background color from the stylesheet"""
-        # Extract the background color from the stylesheet
-        # This matches the bg_primary color defined in apply_styles
-        return "#0b0b0b"
+        return BG_PRIMARY
     
     def create_grammar_tab(self, content) -> QWidget:
         """Create grammar tab with scrollable cards and fade overlay"""
@@ -491,35 +824,22 @@ class PopupWindow(QMainWindow):
         content_layout = QVBoxLayout(content_widget)
         content_layout.setContentsMargins(16, 16, 16, 16)
         content_layout.setSpacing(12)
+        # Keeps cards packed at the top without a trailing stretch item
+        content_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         
         # Parse and create grammar cards
         # If content is already a JSON array/list, prefer that
+        # Items already carry the card keys and GrammarCard reads them with
+        # .get() defaults, so the dicts are used as-is
         word_explanations = []
         try:
-            import json
             if isinstance(content, list):
-                for item in content:
-                    word_explanations.append({
-                        'word': item.get('word', ''),
-                        'explanation': item.get('explanation', ''),
-                        'function': item.get('function', ''),
-                        'additional_info': item.get('additional_info', ''),
-                        'examples': item.get('examples', ''),
-                        'difficulty': item.get('difficulty', ''),
-                    })
+                word_explanations = [item for item in content if isinstance(item, dict)]
             elif isinstance(content, str):
                 c = content.strip()
                 if c.startswith('[') and c.endswith(']'):
-                    grammar_items = json.loads(c)
-                    for item in grammar_items:
-                        word_explanations.append({
-                            'word': item.get('word', ''),
-                            'explanation': item.get('explanation', ''),
-                            'function': item.get('function', ''),
-                            'additional_info': item.get('additional_info', ''),
-                            'examples': item.get('examples', ''),
-                            'difficulty': item.get('difficulty', ''),
-                        })
+                    grammar_items = _json_loads(c)
+                    word_explanations = [item for item in grammar_items if isinstance(item, dict)]
         except Exception:
             # Fall back to text parsing
             pass
@@ -527,14 +847,35 @@ class PopupWindow(QMainWindow):
         if not word_explanations:
             # Only attempt string parsing if the content is a string
             if isinstance(content, str):
-                word_explanations = self.parse_grammar_content(content)
+                word_explanations = self.take_parsed_grammar(content)
             else:
                 word_explanations = []
         
         if word_explanations:
-            for word_data in word_explanations:
-                card = GrammarCard(word_data)
-                content_layout.addWidget(card)
+            self._card_data = word_explanations
+            self._card_layout = content_layout
+            self._card_scroll_area = scroll_area
+            for index, word_data in enumerate(word_explanations):
+                if index < self.EAGER_CARD_COUNT:
+                    content_layout.addWidget(GrammarCard(word_data))
+                    self._realized.add(index)
+                else:
+                    # Reserve roughly a card's height so the scroll range stays close
+                    placeholder = QWidget()
+                    placeholder.setFixedHeight(self.PLACEHOLDER_CARD_HEIGHT)
+                    content_layout.addWidget(placeholder)
+
+            if len(word_explanations) > self.EAGER_CARD_COUNT:
+                # One reusable single-shot timer; restarting it while it is
+                # pending is skipped, so a burst of notifications costs one pass
+                self._realize_timer = QTimer(self)
+                self._realize_timer.setSingleShot(True)
+                self._realize_timer.setInterval(self.REALIZE_THROTTLE_MS)
+                self._realize_timer.timeout.connect(self.realize_visible_cards)
+                
+                scroll_bar = scroll_area.verticalScrollBar()
+                scroll_bar.valueChanged.connect(self.schedule_card_realization)
+                scroll_bar.rangeChanged.connect(self.schedule_card_realization)
         else:
             # Fallback for unparseable content
             message = "No grammar explanation available."
@@ -545,7 +886,6 @@ class PopupWindow(QMainWindow):
             fallback_label.setObjectName("fallbackText")
             content_layout.addWidget(fallback_label)
         
-        content_layout.addStretch()
         scroll_area.setWidget(content_widget)
         tab_layout.addWidget(scroll_area)
         
@@ -556,6 +896,40 @@ class PopupWindow(QMainWindow):
         
         return tab
     
+    def schedule_card_realization(self, *args):
+        """Coalesce scroll/resize notifications into one realization pass per frame"""
+        if not self._realize_timer.isActive():
+            self._realize_timer.start()
+
+    def realize_visible_cards(self):
+        """Replace placeholders that intersect the viewport with real grammar cards"""
+        scroll_area = self._card_scroll_area
+        value = scroll_area.verticalScrollBar().value()
+        top = max(0, value - self.REALIZE_OVERSCAN)
+        bottom = value + scroll_area.viewport().height() + self.REALIZE_OVERSCAN
+
+        # Cards are stacked top to bottom, so bisect for the first one
+        # reaching the visible band and stop at the first one past it
+        # (hand-rolled: bisect only accepts key= from Python 3.10)
+        layout = self._card_layout
+        card_count = len(self._card_data)
+        first, last = 0, card_count
+        while first < last:
+            middle = (first + last) // 2
+            if layout.itemAt(middle).geometry().bottom() < top:
+                first = middle + 1
+            else:
+                last = middle
+        for index in range(first, card_count):
+            placeholder = layout.itemAt(index).widget()
+            if placeholder.geometry().top() > bottom:
+                break
+            if index in self._realized:
+                continue
+            layout.replaceWidget(placeholder, GrammarCard(self._card_data[index]))
+            placeholder.deleteLater()
+            self._realized.add(index)
+    
     def create_footer(self, parent_layout):
         """Create footer with copy button and status"""
         footer_frame = QFrame()
@@ -582,296 +956,80 @@ class PopupWindow(QMainWindow):
         copy_shortcut = QShortcut(QKeySequence("Ctrl+C"), self)
         copy_shortcut.activated.connect(self.copy_content)
     
+    def on_tab_changed(self, index):
+        """Build the grammar tab the first time it becomes current"""
+        if self._pending_grammar is None or self.sender().widget(index) is not self._grammar_page:
+            return
+        content, self._pending_grammar = self._pending_grammar, None
+        self._grammar_page.layout().addWidget(self.create_grammar_tab(content))
+    
     def copy_content(self):
         """Copy current tab content to clipboard"""
         # Implementation for copying content
         pass
     
-    def parse_grammar_content(self, content: str) -> list:
+    def start_grammar_parse(self):
+        """Parse plain-text grammar on the thread pool while the window is built"""
+        grammar = self.translation_data.get('grammar')
+        if ('grammar_json' in self.translation_data or 'grammar_parsed' in self.translation_data
+                or not isinstance(grammar, str)):
+            return
+
+        def parse():
+            parsed = PopupWindow.parse_grammar_content(grammar)
+            with QMutexLocker(self._parse_mutex):
+                self._parsed_grammar = parsed
+
+        QThreadPool.globalInstance().start(parse)
+
+    def take_parsed_grammar(self, content: str) -> list:
+        """Return the background parse result, parsing synchronously if it is not ready yet"""
+        with QMutexLocker(self._parse_mutex):
+            parsed = self._parsed_grammar
+        if parsed is None:
+            parsed = self.parse_grammar_content(content)
+        return parsed
+
+    @staticmethod
+    def parse_grammar_content(content: str) -> list:
         """Parse grammar content into word explanation data"""
         word_explanations = []
-        lines = content.strip().split('\n')
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Handle lines that start with dash or just contain the word explanations
-            if line.startswith('-'):
-                line = line.lstrip('- ')
+        # One scan yields (word, rest, rest before the last parenthesis, text in it)
+        for word, rest, head, function in _GRAMMAR_LINE_RE.findall(content):
+            word = word.strip()
             
-            # Parse "word: explanation (function)" format or similar variations
-            if ':' in line:
-                parts = line.split(':', 1)
-                word = parts[0].strip()
-                rest = parts[1].strip()
-                
-                # Extract function from parentheses - look for patterns like (sustantivo), (verbo), etc.
+            # Only treat the parenthesized text as a function if it looks like a grammatical term
+            if function and _GRAMMAR_FUNCTION_RE.search(function):
+                explanation = head
+            else:
                 function = ''
                 explanation = rest
-                
-                # Look for parentheses containing grammatical function
-                if '(' in rest and ')' in rest:
-                    func_start = rest.rfind('(')
-                    func_end = rest.rfind(')')
-                    if func_start < func_end:
-                        potential_function = rest[func_start+1:func_end]
-                        # Only treat as function if it looks like a grammatical term
-                        if any(term in potential_function.lower() for term in [
-                            'sustantivo', 'verbo', 'adjetivo', 'adverbio', 'preposición', 
-                            'conjunción', 'pronombre', 'artículo', 'presente', 'pasado',
-                            'participio', 'infinitivo', 'singular', 'plural', 'femenino', 'masculino'
-                        ]):
-                            function = potential_function
-                            explanation = rest[:func_start].strip()
-                
-                # Clean up the explanation - remove extra quotes or formatting
-                explanation = explanation.strip('"\'""')
-                
-                if word and explanation:  # Only add if we have both word and explanation
-                    word_explanations.append({
-                        'word': word,
-                        'explanation': explanation,
-                        'function': function
-                    })
+            
+            # Clean up the explanation - remove extra quotes or formatting
+            explanation = explanation.strip().strip('"\'""')
+            
+            if word and explanation:  # Only add if we have both word and explanation
+                word_explanations.append({
+                    'word': word,
+                    'explanation': explanation,
+                    'function': function
+                })
         
         return word_explanations
     
     def center_on_screen(self):
         """Center the window on the screen"""
-        if QApplication.primaryScreen():
-            screen_geometry = QApplication.primaryScreen().availableGeometry()
+        screen = QApplication.primaryScreen()
+        if screen:
+            screen_geometry = screen.availableGeometry()
             x = (screen_geometry.width() - self.width()) // 2
             y = (screen_geometry.height() - self.height()) // 2
             self.move(x, y)
     
     def apply_styles(self):
         """Apply modern styling to the popup"""
-        # Get colors from palette for theme compatibility
-        palette = self.palette()
-        
-        # High-contrast palette: almost black/white with blue accents
-        bg_primary = "#0b0b0b"          # near black
-        bg_secondary = "#111111"        # slightly lighter black
-        text_primary = "#f4f4f4"        # near white
-        text_secondary = "#b9b9b9"      # muted grey
-        accent_color = "#2aa3ff"       # vivid blue
-        card_bg = "#1a1a1a"            # dark card background
-        border_color = "#2a2a2a"       # subtle dark border
-        
-        style = f"""
-        QMainWindow {{
-            background: transparent;
-        }}
-        
-        #centralWidget {{
-            background: {bg_primary};
-            border-radius: 12px;
-            border: none;
-        }}
-        
-        #headerFrame {{
-            background: transparent;
-            border: none;
-            padding: 8px 0px;
-        }}
-        
-        #titlePrefix, #titleSuffix {{
-            font-size: 24px;
-            font-weight: 300;
-            color: {text_primary};
-        }}
-        
-        #titleAccent {{
-            font-size: 24px;
-            font-weight: 900;
-            color: {accent_color};
-        }}
-        
-        #subtitle {{
-            font-size: 12px;
-            color: {text_secondary};
-            font-weight: 400;
-        }}
-        
-        #closeButton {{
-            background: transparent;
-            border: none;
-            border-radius: 16px;
-            color: {text_secondary};
-            font-size: 18px;
-            font-weight: bold;
-        }}
-        
-        #closeButton:hover {{
-            background: rgba(255, 0, 0, 0.15);
-            border: none;
-            color: #ff6b6b;
-        }}
-        
-        #closeButton:pressed {{
-            background: rgba(255, 0, 0, 0.25);
-        }}
-        
-        #mainTabs {{
-            background: transparent;
-            border: none;
-        }}
-        
-        #mainTabs::pane {{
-            border: none;
-            border-radius: 8px;
-            background: {bg_secondary};
-        }}
-        
-        #mainTabs::tab-bar {{
-            /* alignment: center; */
-        }}
-        
-        #mainTabs QTabBar::tab {{
-            background: {bg_secondary};
-            border: none;
-            padding: 8px 16px;
-            margin-right: 2px;
-            border-top-left-radius: 8px;
-            border-top-right-radius: 8px;
-            color: {text_secondary};
-        }}
-        
-        #mainTabs QTabBar::tab:hover {{
-            background: rgba(42, 163, 255, 0.12);
-            color: {accent_color};
-        }}
-        
-        #mainTabs QTabBar::tab:selected {{
-            background: {bg_primary};
-            color: {accent_color};
-            border: none;
-        }}
-        
-        #textDisplay {{
-            background: transparent;
-            border: none;
-            color: {text_primary};
-            font-size: 14px;
-            padding: 8px;
-        }}
-        
-        #grammarScrollArea {{
-            background: transparent;
-            border: none;
-        }}
-        
-        #grammarCard {{
-            background: {card_bg};
-            border: 2px solid {border_color};
-            border-radius: 16px;
-            margin-bottom: 16px;
-            padding: 8px;
-        }}
-        
-        #grammarCard:hover {{
-            background: rgba(76, 175, 80, 0.15);
-            border: 2px solid rgba(76, 175, 80, 0.5);
-        }}
-        
-        #wordTitle {{
-            color: {accent_color};
-            font-size: 20px;
-            font-weight: 900;
-        }}
-        
-        #difficultyIndicator {{
-            color: {accent_color};
-            font-size: 14px;
-            font-weight: 700;
-        }}
-        
-        #grammarFunction {{
-            color: {text_secondary};
-            font-size: 14px;
-            font-style: italic;
-            font-weight: 600;
-        }}
-        
-        #grammarExplanation {{
-            color: {text_primary};
-            font-size: 16px;
-            font-weight: 500;
-        }}
-        
-        #grammarDetails {{
-            color: {text_secondary};
-            font-size: 13px;
-            font-style: italic;
-        }}
-        
-        #grammarExamples {{
-            color: {accent_color};
-            font-size: 13px;
-            font-weight: 500;
-        }}
-        
-        #cardSeparator {{
-            background: {accent_color};
-            opacity: 0.6;
-        }}
-        
-        #fallbackText {{
-            color: {text_primary};
-            font-size: 14px;
-        }}
-        
-        #footerFrame {{
-            background: transparent;
-            border: none;
-        }}
-        
-        #statusText {{
-            color: {text_secondary};
-            font-size: 12px;
-        }}
-        
-        #copyButton {{
-            background: {accent_color};
-            color: white;
-            border: none;
-            border-radius: 6px;
-            padding: 6px 12px;
-            font-weight: 600;
-        }}
-        
-        #copyButton:hover {{
-            background: rgba(0, 212, 255, 0.9);
-        }}
-        
-        #copyButton:pressed {{
-            background: rgba(0, 212, 255, 0.7);
-        }}
-        
-        QScrollBar:vertical {{
-            background: {bg_secondary};
-            width: 8px;
-            border-radius: 4px;
-        }}
-        
-        QScrollBar::handle:vertical {{
-            background: {border_color};
-            border-radius: 4px;
-            min-height: 20px;
-        }}
-        
-        QScrollBar::handle:vertical:hover {{
-            background: {accent_color};
-        }}
-        
-        QScrollBar::handle:vertical:pressed {{
-            background: rgba(0, 212, 255, 0.8);
-        }}
-        """
-        
-        self.setStyleSheet(style)
+        self.setStyleSheet(_STYLESHEET)
     
     def paintEvent(self, event):
         """Custom paint event for rounded background"""
@@ -884,17 +1042,24 @@ class PopupWindow(QMainWindow):
         event.accept()
 
 
-def create_sample_data():
-    """Create sample translation data for testing"""
-    return {
-        'original': 'Che poi ti vengo a cercare',
-        'translation': 'Que luego vengo a buscarte',
-        'grammar': '''- Che: que (conjunción)
+_SAMPLE_GRAMMAR = '''- Che: que (conjunción)
 - poi: luego (adverbio)
 - ti: a ti (pronombre de objeto indirecto)
 - vengo: vengo (verbo venir en primera persona del singular, presente indicativo)
 - a: a (preposición que introduce el complemento de régimen)
 - cercare: buscar (verbo en infinitivo)'''
+
+# The sample never changes, so it is parsed once instead of on every popup
+_SAMPLE_GRAMMAR_PARSED = PopupWindow.parse_grammar_content(_SAMPLE_GRAMMAR)
+
+
+def create_sample_data():
+    """Create sample translation data for testing"""
+    return {
+        'original': 'Che poi ti vengo a cercare',
+        'translation': 'Que luego vengo a buscarte',
+        'grammar': _SAMPLE_GRAMMAR,
+        'grammar_parsed': _SAMPLE_GRAMMAR_PARSED,
     }
 
 
@@ -31,3 +31,37 @@ def test_parse_malformed_returns_defaults():
     assert result["translation"] == ""
     assert result["grammar_json"] == []
 
+
+def test_parse_malformed_json_normalizes_fallback_grammar():
+    # Missing comma forces the regex fallback; grammar array itself is valid JSON
+    s = '{"original": "Ciao" "translation": "Hola", "grammar": [{"word": 1}, "x", {"word": " Ciao ", "explanation": "Hola"}]}'
+    result = parse_and_validate_translation(s)
+    assert result["original"] == "Ciao"
+    assert result["grammar_json"] == [
+        {"word": "1", "explanation": "", "function": "", "additional_info": "", "examples": "", "difficulty": ""},
+        {"word": "Ciao", "explanation": "Hola", "function": "", "additional_info": "", "examples": "", "difficulty": ""},
+    ]
+    assert result["grammar"].endswith("- Ciao: Hola")
+
+
+def test_parse_repeated_string_returns_independent_results():
+    s = json.dumps({"original": "Ciao", "translation": "Hola",
+                    "grammar": [{"word": "Ciao", "explanation": "Hola"}]})
+    first = parse_and_validate_translation(s)
+    first["grammar_json"][0]["word"] = "changed"
+    first["grammar_json"].append({})
+    second = parse_and_validate_translation(s)
+    assert second["grammar_json"] == [{
+        "word": "Ciao", "explanation": "Hola", "function": "",
+        "additional_info": "", "examples": "", "difficulty": "",
+    }]
+    assert second["grammar"] == "- Ciao: Hola"
+
+
+def test_parse_string_with_nan_keeps_json_path():
+    # json.dumps writes NaN by default; orjson rejects it, the stdlib accepts it
+    s = ('{"original": "caf\\u00e9 \\"x\\"", "translation": "b", "score": NaN, "n": 1e999, '
+         '"grammar": [{"word": "x]y", "explanation": "e"}, {"word": "z", "explanation": "f"}]}')
+    result = parse_and_validate_translation(s)
+    assert result["original"] == 'café "x"'
+    assert [item["word"] for item in result["grammar_json"]] == ["x]y", "z"]
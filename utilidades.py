@@ -1,9 +1,17 @@
 import os
-from datetime import datetime
+import time
+
+# Folders already created in this process, so captures skip the makedirs syscalls
+_ENSURED_DIRS = set()
 
 def save_image(image):
     folder = "subtitle_captures"
-    os.makedirs(folder, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    path = os.path.join(folder, f"sub_{timestamp}.png")
+    if folder not in _ENSURED_DIRS:
+        os.makedirs(folder, exist_ok=True)
+        _ENSURED_DIRS.add(folder)
+    # One clock read for both parts; the millisecond suffix keeps captures
+    # taken within the same second from overwriting each other
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(seconds))
+    path = os.path.join(folder, f"sub_{timestamp}_{nanos // 1_000_000:03d}.png")
     image.save(path)
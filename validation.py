@@ -23,34 +23,88 @@ Returned normalized schema (dict):
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 import json
 import re
 
+# orjson is an optional speedup. It rejects some input json.loads accepts
+# (NaN/Infinity, overflowing numbers like 1e999, lone surrogates), so a
+# failed orjson decode is retried with json.loads before any regex fallback
+try:
+    import orjson
+except ImportError:
+    _json_loads = json.loads
+else:
+    def _json_loads(s: str) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return json.loads(s)
+
+# Fallback extraction patterns, compiled once rather than on every malformed payload
+_ORIGINAL_RE = re.compile(r'"original"\s*:\s*"([\s\S]*?)"')
+_TRANSLATION_RE = re.compile(r'"translation"\s*:\s*"([\s\S]*?)"')
+_GRAMMAR_ARR_RE = re.compile(r'"grammar"\s*:\s*(\[[\s\S]*?\])')
+_TRAILING_COMMA_RE = re.compile(r",\s*\]")
+_OBJ_RE = re.compile(r"\{[\s\S]*?\}")
+_GRAMMAR_FIELDS = ('word', 'explanation', 'function', 'additional_info', 'examples', 'difficulty')
+_FIELD_RES = {
+    name: re.compile(fr'"{name}"\s*:\s*"([\s\S]*?)"')
+    for name in _GRAMMAR_FIELDS
+}
+
 
 def _as_string(value: Any) -> str:
     return value if isinstance(value, str) else "" if value is None else str(value)
 
 
-def _normalize_grammar_items(value: Any) -> List[Dict[str, Any]]:
-    if isinstance(value, list):
-        result: List[Dict[str, Any]] = []
-        for item in value:
-            if isinstance(item, dict):
-                result.append({
-                    "word": _as_string(item.get("word", "")).strip(),
-                    "explanation": _as_string(item.get("explanation", "")).strip(),
-                    "function": _as_string(item.get("function", "")).strip(),
-                    "additional_info": _as_string(item.get("additional_info", "")).strip(),
-                    "examples": _as_string(item.get("examples", "")).strip(),
-                    "difficulty": _as_string(item.get("difficulty", "")).strip(),
-                })
+def _normalize_grammar(value: Any) -> Tuple[List[Dict[str, Any]], str]:
+    """Normalize raw grammar items and render their text lines in a single pass."""
+    items: List[Dict[str, Any]] = []
+    lines: List[str] = []
+    if not isinstance(value, list):
+        return items, ""
+    # Hot loop: locals instead of globals, and the common str case inlined
+    # ahead of the conversion. Missing keys come back as None and skip the
+    # strip; optional fields are usually absent
+    append_item = items.append
+    for item in value:
+        if not isinstance(item, dict):
+            continue
+        get = item.get
+        v = get("word")
+        word = v.strip() if type(v) is str else "" if v is None else str(v).strip()
+        v = get("explanation")
+        explanation = v.strip() if type(v) is str else "" if v is None else str(v).strip()
         # keep only entries that have at least word or explanation
-        return [g for g in result if g["word"] or g["explanation"]]
-    return []
+        if not (word or explanation):
+            continue
+        v = get("function")
+        function = v.strip() if type(v) is str else "" if v is None else str(v).strip()
+        v = get("additional_info")
+        additional_info = v.strip() if type(v) is str else "" if v is None else str(v).strip()
+        v = get("examples")
+        examples = v.strip() if type(v) is str else "" if v is None else str(v).strip()
+        v = get("difficulty")
+        difficulty = v.strip() if type(v) is str else "" if v is None else str(v).strip()
+        append_item({
+            "word": word,
+            "explanation": explanation,
+            "function": function,
+            "additional_info": additional_info,
+            "examples": examples,
+            "difficulty": difficulty,
+        })
+        line = f"- {word}: {explanation}" if word else f"- {explanation}"
+        if function:
+            line += f" ({function})"
+        lines.append(line)
+    return items, "\n".join(lines)
 
 
 def _build_grammar_text(items: List[Dict[str, Any]]) -> str:
+    """Render already-normalized grammar items as text lines."""
     lines: List[str] = []
     for item in items:
         word = item.get("word", "").strip()
@@ -108,11 +162,56 @@ def _parse_grammar_text_to_items(grammar_text: str) -> List[Dict[str, Any]]:
     return [i for i in items if i['word'] or i['explanation']]
 
 
+def _build_result(original: str, translation: str, grammar_items: List[Dict[str, Any]],
+                  grammar_text: Optional[str] = None) -> Dict[str, Any]:
+    if grammar_text is None:
+        grammar_text = _build_grammar_text(grammar_items)
+    return {
+        "original": original,
+        "translation": translation,
+        "grammar": grammar_text,
+        "grammar_json": grammar_items,
+    }
+
+
+def _validate_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize an already-decoded payload dict."""
+    v = data.get("original", "")
+    original = v.strip() if type(v) is str else _as_string(v).strip()
+    v = data.get("translation", "")
+    translation = v.strip() if type(v) is str else _as_string(v).strip()
+    raw_grammar = data.get("grammar", [])
+    grammar_items, grammar_text = _normalize_grammar(raw_grammar)
+    # If grammar provided as plain text, parse into items
+    if not grammar_items and isinstance(raw_grammar, str) and raw_grammar.strip():
+        grammar_items = _parse_grammar_text_to_items(raw_grammar)
+        grammar_text = None
+    return _build_result(original, translation, grammar_items, grammar_text)
+
+
 def parse_and_validate_translation(payload: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
     """Parse a translation payload (JSON string or dict) and return a normalized dict.
 
     Never raises on malformed payloads; returns a minimal structure with empty fields instead.
     """
+    # Dicts from in-process callers need neither JSON decoding nor the regex fallback
+    if isinstance(payload, dict):
+        return _validate_data(payload)
+    if isinstance(payload, str):
+        # Copy the cached containers so callers may mutate the result
+        result = _parse_str(payload)
+        return {**result, "grammar_json": [item.copy() for item in result["grammar_json"]]}
+    return _parse_payload(payload)
+
+
+@lru_cache(maxsize=32)
+def _parse_str(payload: str) -> Dict[str, Any]:
+    """Memoized string path; callers must copy the result before handing it out."""
+    return _parse_payload(payload)
+
+
+def _parse_payload(payload: Any) -> Dict[str, Any]:
+    """Decode a non-dict payload, falling back to regex extraction when JSON fails."""
     original: str = ""
     translation: str = ""
     grammar_items: List[Dict[str, Any]] = []
@@ -124,55 +223,49 @@ def parse_and_validate_translation(payload: Union[str, Dict[str, Any]]) -> Dict[
             # Remove common code fences if present
             if s.startswith('```'):
                 s = s.strip('`')
-            # Extract object if the string contains extra wrapper text
+            # Extract object if the string contains extra wrapper text. Both
+            # scans stop at the first hit from their end, and the closing
+            # brace is only searched for after an opening one
             start = s.find('{')
-            end = s.rfind('}')
-            if start != -1 and end != -1 and end > start:
-                s = s[start:end+1]
-            data = json.loads(s)
-        elif isinstance(payload, dict):
-            data = payload
+            if start != -1:
+                end = s.rfind('}', start + 1)
+                if end != -1:
+                    s = s[start:end+1]
+            data = _json_loads(s)
         else:
             data = {}
-
-        original = _as_string(data.get("original", "")).strip()
-        translation = _as_string(data.get("translation", "")).strip()
-        raw_grammar = data.get("grammar", [])
-        grammar_items = _normalize_grammar_items(raw_grammar)
-        # If grammar provided as plain text, parse into items
-        if not grammar_items and isinstance(raw_grammar, str) and raw_grammar.strip():
-            grammar_items = _parse_grammar_text_to_items(raw_grammar)
+        return _validate_data(data)
     except Exception:
         # Fallback: regex-based extraction from raw text even if JSON is malformed/codefenced
         try:
             s = payload if isinstance(payload, str) else json.dumps(payload)
-            # Strip code fences
-            s = re.sub(r"```(json)?", "", s)
+            # Strip code fences; both forms are literal, so no regex is needed
+            s = s.replace("```json", "").replace("```", "")
             # Pull original/translation if present
-            m_orig = re.search(r'"original"\s*:\s*"([\s\S]*?)"', s)
-            m_trans = re.search(r'"translation"\s*:\s*"([\s\S]*?)"', s)
+            m_orig = _ORIGINAL_RE.search(s)
+            m_trans = _TRANSLATION_RE.search(s)
             if m_orig:
                 original = m_orig.group(1).strip()
             if m_trans:
                 translation = m_trans.group(1).strip()
             # Try grammar array extraction
-            m_gram = re.search(r'"grammar"\s*:\s*(\[[\s\S]*?\])', s)
+            m_gram = _GRAMMAR_ARR_RE.search(s)
             if m_gram:
                 gram_str = m_gram.group(1)
                 try:
-                    grammar_items = json.loads(gram_str)
+                    grammar_items, _ = _normalize_grammar(_json_loads(gram_str))
                 except Exception:
                     # Attempt to repair trailing comma issues
-                    gram_repaired = re.sub(r",\s*\]", "]", gram_str)
+                    gram_repaired = _TRAILING_COMMA_RE.sub("]", gram_str)
                     try:
-                        grammar_items = json.loads(gram_repaired)
+                        grammar_items, _ = _normalize_grammar(_json_loads(gram_repaired))
                     except Exception:
                         # Last resort: extract per-item objects with regex
-                        obj_matches = re.findall(r"\{[\s\S]*?\}", gram_str)
+                        obj_matches = _OBJ_RE.findall(gram_str)
                         extracted: List[Dict[str, Any]] = []
                         for obj in obj_matches:
                             def _field(name: str) -> str:
-                                m = re.search(fr'"{name}"\s*:\s*"([\s\S]*?)"', obj)
+                                m = _FIELD_RES[name].search(obj)
                                 return m.group(1).strip() if m else ""
                             item = {
                                 'word': _field('word'),
@@ -189,13 +282,6 @@ def parse_and_validate_translation(payload: Union[str, Dict[str, Any]]) -> Dict[
             # keep defaults if everything fails
             pass
 
-    grammar_text = _build_grammar_text(grammar_items)
-
-    return {
-        "original": original,
-        "translation": translation,
-        "grammar": grammar_text,
-        "grammar_json": grammar_items,
-    }
+    return _build_result(original, translation, grammar_items)
 
 